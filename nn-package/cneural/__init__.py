@@ -0,0 +1,56 @@
+"""
+#### what
+    - neural network from scratch: layers, activations, losses, optimizers and the Model that ties them.
+#### Flow
+    - `import cneural` loads nothing but this file, numpy included.
+    - a public name (cneural.Layer_Dense, from cneural import Model, ...) imports its submodule on first access.
+    - submodules: layers, activations, losses, optimizers, model, dataset, kernels, pruning, scoring.
+    - python -m cneural checks the import time budget.
+"""
+import importlib
+
+__version__ = "0.1.0"
+
+# public name -> submodule it lives in
+_exports = {
+    "make_rng": "layers",
+    "Layer_Input": "layers",
+    "Layer_Dense": "layers",
+    "Layer_Dropout": "layers",
+    "Activation_ReLU": "activations",
+    "Activation_Softmax": "activations",
+    "Activation_Sigmoid": "activations",
+    "Activation_Linear": "activations",
+    "Loss": "losses",
+    "Loss_CategoricalCrossentropy": "losses",
+    "Activation_Softmax_Loss_CategoricalCrossentropy": "losses",
+    "Loss_BinaryCrossentropy": "losses",
+    "Loss_MeanSquaredError": "losses",
+    "Loss_MeanAbsoluteError": "losses",
+    "Optimizer_SGD": "optimizers",
+    "Optimizer_Adagrad": "optimizers",
+    "Optimizer_RMSprop": "optimizers",
+    "Optimizer_Adam": "optimizers",
+    "Model": "model",
+    "Dataset_Shards": "dataset",
+    "Scorer": "scoring",
+}
+_submodules = {"layers", "activations", "losses", "optimizers", "model", "dataset", "kernels", "pruning", "scoring"}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(importlib.import_module(f".{_exports[name]}", __name__), name)
+    elif name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache it, __getattr__ only runs once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | _submodules)
@@ -0,0 +1,49 @@
+"""
+- python -m cneural: import time budget check for short lived jobs and CLI tools.
+- each statement runs in fresh interpreters (best of a few runs, the first may pay for cold disk caches).
+- bare `import cneural` must stay within BUDGET_MS and must not pull in numpy.
+- `from cneural import Model`, what jobs actually run, may cost at most MODEL_OVERHEAD_MS over a bare `import numpy`.
+"""
+import os
+import subprocess
+import sys
+
+BUDGET_MS = 20.
+MODEL_OVERHEAD_MS = 30.
+
+CHECK = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1e3, 'numpy' in sys.modules)
+"""
+
+
+def import_ms(statement: str, runs: int = 5):
+    """
+    - best wall time of statement in ms over runs fresh interpreters, and whether numpy got imported.
+    """
+    # the package next to this directory, whether installed or not
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), os.environ.get("PYTHONPATH")])))
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", CHECK.format(statement=statement)], env=env,
+                                capture_output=True, text=True, check=True).stdout.split()
+        results.append((float(output[0]), output[1] == "True"))
+    return min(ms for ms, _ in results), any(numpy for _, numpy in results)
+
+
+def main() -> int:
+    bare_ms, numpy_loaded = import_ms("import cneural")
+    numpy_ms, _ = import_ms("import numpy")
+    model_ms, _ = import_ms("from cneural import Model")
+    overhead = model_ms - numpy_ms
+    print(f"import cneural: {bare_ms:.2f} ms (budget {BUDGET_MS:.0f} ms), numpy imported: {numpy_loaded}")
+    print(f"from cneural import Model: {model_ms:.2f} ms, import numpy: {numpy_ms:.2f} ms, " +
+          f"overhead: {overhead:.2f} ms (budget {MODEL_OVERHEAD_MS:.0f} ms)")
+    return 0 if bare_ms <= BUDGET_MS and not numpy_loaded and overhead <= MODEL_OVERHEAD_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
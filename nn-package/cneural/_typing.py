@@ -0,0 +1,5 @@
+# annotation only aliases, imported under TYPE_CHECKING so they cost nothing at runtime
+import numpy as np
+from typing import Tuple
+
+Float64Array2D = np.ndarray[Tuple[int, int], np.dtype[np.float64]]
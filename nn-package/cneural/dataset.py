@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+import numpy as np
+from typing import TYPE_CHECKING
+
+from .layers import make_rng
+
+if TYPE_CHECKING:
+    from typing import List, Dict, Optional, Tuple, Iterator, Union
+    from numpy.typing import DTypeLike
+
+    ShardPath = Union[str, Tuple[str, str]]
+
+
+class Dataset_Shards:
+    """
+    #### what
+        - stream (X, y) batches from many on-disk shards without holding the dataset in memory.
+        - args: shards, batch_size, shuffle_buffer, dtype, seed
+    #### Improve
+        - read the next shard in a background thread while the current one is trained on.
+    #### Flow
+        - [init -> batches(epoch) -> stats]
+        - shard is either an .npz path (with x_key, y_key members) or a (X.npy, y.npy) path pair.
+        - .npy shards are memory-mapped, only the rows copied into the buffer are read.
+        - shard order is permuted per epoch, rows are shuffled inside a bounded buffer (approximate global shuffle).
+        - memory use is the buffer (shuffle_buffer rows) plus one .npz shard, independent of dataset size.
+    """
+
+    def __init__(self,
+                 shards: List[ShardPath],
+                 batch_size: int,
+                 *,
+                 shuffle_buffer: int = 10000,
+                 dtype: DTypeLike = np.float64,
+                 x_key: str = "X",
+                 y_key: str = "y",
+                 drop_last: bool = False,
+                 seed: Optional[int] = None) -> None:
+        """
+        #### Note
+            - shuffle_buffer=0 disables shuffling, batches come out in shard order.
+            - shuffle_buffer is rounded up to hold at least two batches.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive: {batch_size}")
+        self.shards = list(shards)
+        self.batch_size = batch_size
+        self.shuffle = shuffle_buffer > 0
+        self.capacity = max(shuffle_buffer, 2 * batch_size)
+        self.dtype = np.dtype(dtype)
+        self.x_key = x_key
+        self.y_key = y_key
+        self.drop_last = drop_last
+        self.seed = seed
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.rows_read = 0
+        self.bytes_read = 0
+        self.read_seconds = 0.
+        self.wall_seconds = 0.
+
+    def stats(self) -> Dict[str, float]:
+        """
+        #### Note
+            - read_fraction close to 1 means the loop waits on I/O, close to 0 means it waits on compute.
+        """
+        return {
+            "rows": self.rows_read,
+            "bytes": self.bytes_read,
+            "read_seconds": self.read_seconds,
+            "wall_seconds": self.wall_seconds,
+            "read_MBps": self.bytes_read / 1e6 / self.read_seconds if self.read_seconds else 0.,
+            "rows_per_second": self.rows_read / self.wall_seconds if self.wall_seconds else 0.,
+            "read_fraction": self.read_seconds / self.wall_seconds if self.wall_seconds else 0.,
+        }
+
+    def tick(self, mark: float) -> float:
+        """
+        - adds time since mark to wall_seconds, time spent by the consumer between batches included.
+        """
+        now = time.perf_counter()
+        self.wall_seconds += now - mark
+        return now
+
+    def open_shard(self, shard: ShardPath) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        - returns lazily readable X and y of a shard.
+        """
+        if isinstance(shard, tuple):
+            return np.load(shard[0], mmap_mode="r"), np.load(shard[1], mmap_mode="r")
+        with np.load(shard) as archive:
+            return archive[self.x_key], archive[self.y_key]
+
+    def batches(self, epoch: int = 0, rng: Optional[np.random.Generator] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        #### Note
+            - shuffles with rng when given (Model.train passes a stream of the model seed), else make_rng(self.seed, epoch).
+            - same seed and epoch give the same batch sequence.
+            - rows are copied into a preallocated buffer of self.dtype, dtype conversion happens in bulk on that copy.
+            - once the buffer is full, a random half of it is emitted as batches and the rest stays for mixing.
+        """
+        if rng is None:
+            rng = make_rng(self.seed, epoch)
+        order = rng.permutation(len(self.shards)) if self.shuffle else range(len(self.shards))
+        buffer_X = buffer_y = None
+        filled = 0
+        wall_mark = time.perf_counter()
+
+        for shard_index in order:
+            read_start = time.perf_counter()
+            shard_X, shard_y = self.open_shard(self.shards[shard_index])
+            self.read_seconds += time.perf_counter() - read_start
+            if buffer_X is None:
+                buffer_X = np.empty((self.capacity,) + shard_X.shape[1:], dtype=self.dtype)
+                buffer_y = np.empty((self.capacity,) + shard_y.shape[1:], dtype=shard_y.dtype)
+            start = 0
+            while start < len(shard_X):
+                # copy as much of the shard as fits
+                count = min(len(shard_X) - start, self.capacity - filled)
+                read_start = time.perf_counter()
+                buffer_X[filled:filled + count] = shard_X[start:start + count]
+                buffer_y[filled:filled + count] = shard_y[start:start + count]
+                self.read_seconds += time.perf_counter() - read_start
+                self.rows_read += count
+                self.bytes_read += count * (shard_X[0].nbytes + shard_y[0].nbytes)
+                filled += count
+                start += count
+                if filled == self.capacity:
+                    emit = (self.capacity // 2) // self.batch_size * self.batch_size
+                    index = rng.permutation(filled) if self.shuffle else np.arange(filled)
+                    for batch_start in range(0, emit, self.batch_size):
+                        batch_index = index[batch_start:batch_start + self.batch_size]
+                        wall_mark = self.tick(wall_mark)
+                        yield buffer_X[batch_index], buffer_y[batch_index]
+                    # move the rows kept for mixing to the front
+                    kept = index[emit:]
+                    buffer_X[:len(kept)] = buffer_X[kept]
+                    buffer_y[:len(kept)] = buffer_y[kept]
+                    filled = len(kept)
+
+        # drain the buffer
+        index = rng.permutation(filled) if self.shuffle else np.arange(filled)
+        for batch_start in range(0, filled, self.batch_size):
+            batch_index = index[batch_start:batch_start + self.batch_size]
+            if self.drop_last and len(batch_index) < self.batch_size:
+                break
+            wall_mark = self.tick(wall_mark)
+            yield buffer_X[batch_index], buffer_y[batch_index]
+        self.tick(wall_mark)
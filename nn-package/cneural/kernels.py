@@ -0,0 +1,212 @@
+"""
+#### what
+    - optional fused elementwise kernels for Activation_ReLU, Activation_Sigmoid and Loss_BinaryCrossentropy.
+    - compiled with numba (single pass, multi-threaded over rows) when it is installed.
+#### Flow
+    - [use(name, array) -> kernel]
+    - activation and loss classes call use() and fall back to their NumPy code when it returns False.
+    - only DEFAULT_KERNELS are active at start, enable(True, name) turns on the others.
+    - numba missing, NNFS_NUMBA=0 in the environment or enable(False) -> NumPy code everywhere.
+    - numba that fails to import or to compile a kernel -> that kernel (all of them on import) is switched off, NumPy code.
+    - python -m cneural.kernels validates the kernels against the NumPy classes and prints the speedup.
+"""
+import os
+import importlib.util
+import numpy as np
+from typing import Tuple
+
+# below this many elements thread start-up costs more than the NumPy temporaries
+MIN_SIZE = 1 << 14
+
+KERNELS = ("relu_backward", "sigmoid_forward", "bce_forward", "bce_backward")
+# on by default: the single pass replaces a copy + mask or a chain of temporaries.
+# sigmoid_forward and bce_forward are bound by exp/log and measured 0.6-1.1x against NumPy,
+# so they stay off until enable(True, name) after benchmark() shows a gain on the target machine.
+DEFAULT_KERNELS = ("relu_backward", "bce_backward")
+
+# numba is only looked up here, it is imported and the kernels compiled on first use (see _compiled)
+available = importlib.util.find_spec("numba") is not None
+active = set(DEFAULT_KERNELS) if available and os.environ.get("NNFS_NUMBA", "1") != "0" else set()
+_kernels = None
+
+
+def enable(flag: bool = True, *names: str) -> None:
+    """
+    - switch kernels (all of them without names) on or off at runtime, ignored when numba is not installed.
+    """
+    names = names or KERNELS
+    if flag and available:
+        active.update(names)
+    else:
+        active.difference_update(names)
+
+
+def use(name: str, *arrays: np.ndarray) -> bool:
+    """
+    - True when kernel name is active, the arrays are 2D, of one shape and big enough to pay off,
+      and the kernel compiles for their types.
+    - the kernels do not check bounds, a shape mismatch is left to the NumPy code to raise.
+    """
+    shape = arrays[0].shape
+    if name not in active or arrays[0].size < MIN_SIZE:
+        return False
+    if not all(array.ndim == 2 and array.shape == shape for array in arrays):
+        return False
+    return _compiled(name, *arrays) is not None
+
+
+def _build() -> dict:
+    """
+    - imports numba and compiles the kernels, keeps numba out of `import cneural`.
+    """
+    import numba
+    from numba import prange
+
+    @numba.njit(parallel=True, cache=True)
+    def relu_backward(dvalues, inputs, out):
+        for i in prange(dvalues.shape[0]):
+            for j in range(dvalues.shape[1]):
+                # same as the NumPy mask: only inputs <= 0 are zeroed, NaN passes dvalues through
+                out[i, j] = 0 if inputs[i, j] <= 0 else dvalues[i, j]
+
+    @numba.njit(parallel=True, cache=True)
+    def sigmoid_forward(inputs, out):
+        for i in prange(inputs.shape[0]):
+            for j in range(inputs.shape[1]):
+                out[i, j] = 1 / (1 + np.exp(-inputs[i, j]))
+
+    @numba.njit(parallel=True, cache=True)
+    def bce_forward(y_pred, y_true, out):
+        outputs = y_pred.shape[1]
+        for i in prange(y_pred.shape[0]):
+            total = 0.
+            for j in range(outputs):
+                clipped = min(max(y_pred[i, j], 1e-7), 1 - 1e-7)
+                total += -(y_true[i, j] * np.log(clipped) + (1 - y_true[i, j]) * np.log(1 - clipped))
+            out[i] = total / outputs
+
+    @numba.njit(parallel=True, cache=True)
+    def bce_backward(dvalues, y_true, out):
+        samples, outputs = dvalues.shape
+        for i in prange(samples):
+            for j in range(outputs):
+                clipped = min(max(dvalues[i, j], 1e-7), 1 - 1e-7)
+                out[i, j] = -((y_true[i, j] / clipped) - (1 - y_true[i, j]) / (1 - clipped)) / outputs / samples
+
+    return {
+        "relu_backward": relu_backward,
+        "sigmoid_forward": sigmoid_forward,
+        "bce_forward": bce_forward,
+        "bce_backward": bce_backward,
+    }
+
+
+def _out(name: str, *arrays: np.ndarray) -> Tuple[Tuple[int, ...], np.dtype]:
+    """
+    - shape and dtype of the array kernel name writes into.
+    """
+    if name == "bce_forward":
+        return arrays[0].shape[:1], np.result_type(*arrays, np.float64)
+    if name == "bce_backward":
+        return arrays[0].shape, np.result_type(*arrays)
+    return arrays[0].shape, arrays[0].dtype
+
+
+def _compiled(name: str, *arrays: np.ndarray):
+    """
+    - kernel name compiled for the types of arrays, None when numba fails to import or to compile it.
+        - import failure (e.g. a numba build that does not support the installed numpy) switches all kernels off.
+        - compile failure switches kernel name off.
+    """
+    global _kernels, available
+    try:
+        if _kernels is None:
+            _kernels = _build()
+        import numba
+        shape, dtype = _out(name, *arrays)
+        out_type = numba.types.Array(numba.from_dtype(dtype), len(shape), "C")
+        # no-op once these types are compiled (or loaded from the cache)
+        _kernels[name].compile(tuple(numba.typeof(array) for array in arrays) + (out_type,))
+    except ImportError:
+        available = False
+        active.clear()
+        return None
+    except Exception:
+        active.discard(name)
+        return None
+    return _kernels[name]
+
+
+# called after use() returned True, which built and compiled the kernel
+def relu_backward(dvalues: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+    out = np.empty(*_out("relu_backward", dvalues, inputs))
+    _kernels["relu_backward"](dvalues, inputs, out)
+    return out
+
+
+def sigmoid_forward(inputs: np.ndarray) -> np.ndarray:
+    out = np.empty(*_out("sigmoid_forward", inputs))
+    _kernels["sigmoid_forward"](inputs, out)
+    return out
+
+
+def bce_forward(y_pred: np.ndarray, y_true: np.ndarray) -> np.ndarray:
+    out = np.empty(*_out("bce_forward", y_pred, y_true))
+    _kernels["bce_forward"](y_pred, y_true, out)
+    return out
+
+
+def bce_backward(dvalues: np.ndarray, y_true: np.ndarray) -> np.ndarray:
+    out = np.empty(*_out("bce_backward", dvalues, y_true))
+    _kernels["bce_backward"](dvalues, y_true, out)
+    return out
+
+
+def benchmark(shape: Tuple[int, int] = (100000, 64), repeat: int = 10) -> None:
+    """
+    - checks every kernel against the NumPy code path of its class, then times both.
+    - the set of active kernels is restored afterwards.
+    """
+    import timeit
+    from .activations import Activation_ReLU, Activation_Sigmoid
+    from .losses import Loss_BinaryCrossentropy
+
+    if not available:
+        print("numba is not installed, NumPy code is used")
+        return
+    rng = np.random.default_rng(0)
+    inputs = rng.standard_normal(shape)
+    inputs[0, 0] = np.nan
+    y_true = rng.integers(0, 2, size=shape)
+    relu, sigmoid, loss = Activation_ReLU(), Activation_Sigmoid(), Loss_BinaryCrossentropy()
+    relu.inputs = inputs
+    sigmoid.forward(inputs, training=False)
+    y_pred = sigmoid.output
+
+    cases = {
+        "relu_backward": (lambda: relu.backward(inputs), lambda: relu.dinputs),
+        "sigmoid_forward": (lambda: sigmoid.forward(inputs, training=False), lambda: sigmoid.output),
+        "bce_forward": (lambda: loss.forward(y_pred, y_true), None),
+        "bce_backward": (lambda: loss.backward(y_pred, y_true), lambda: loss.dinputs),
+    }
+    previous = set(active)
+    for name, (run, result) in cases.items():
+        timings = {}
+        outputs = {}
+        for flag in (False, True):
+            enable(flag, name)
+            value = run()
+            outputs[flag] = value if result is None else result()
+            timings[flag] = min(timeit.repeat(run, number=1, repeat=repeat))
+        equal = np.allclose(outputs[False], outputs[True], rtol=1e-12, atol=0, equal_nan=True)
+        print(f"{name}: equal: {equal}, " +
+              f"numpy: {timings[False] * 1e3:.2f} ms, " +
+              f"numba: {timings[True] * 1e3:.2f} ms, " +
+              f"speedup: {timings[False] / timings[True]:.1f}x, " +
+              f"default: {'on' if name in DEFAULT_KERNELS else 'off'}")
+    active.clear()
+    active.update(previous)
+
+
+if __name__ == "__main__":
+    benchmark()
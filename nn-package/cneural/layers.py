@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Union
+    from numpy.typing import DTypeLike, ArrayLike
+    from ._typing import Float64Array2D
+
+
+def make_rng(seed: Optional[int], *key: int) -> np.random.Generator:
+    """
+    #### what
+        - create an independent Generator stream addressed by seed and an integer key.
+    #### Note
+        - same (seed, key) always gives the same stream, no matter which process creates it or in what order.
+        - seed=None draws fresh entropy, so the stream is not reproducible.
+    """
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=key)))
+
+class Layer_Input:
+    """
+    Layer_Input class represents the input layer of the neural network.
+    """
+
+    def __init__(self, dtype: DTypeLike = np.float64) -> None:
+        self.dtype = dtype
+
+    def forward(self, inputs: ArrayLike, training: bool = False) -> None: 
+        """
+        Performs a forward pass of the input layer.
+
+        #### Parameters:
+        inputs (NDArray): Input data.
+        training (bool): unused, keeps the signature of other layers.
+        """
+        self.output = np.asarray(inputs, dtype=self.dtype)
+
+
+class Layer_Dense:
+    """
+    #### what 
+        - create Dense Layer 
+        - args: nintputs, nneurons, wL1, wL2, bL1, bL2, initializer, dtype, rng
+    #### Improve
+    #### Flow
+        - [init -> (forward -> backward)]
+        - initializer: "random" (0.01 * N(0, 1)), "he" (N(0, 2/n_inputs)) or "xavier" (N(0, 2/(n_inputs + n_neurons)))
+    """
+
+    def __init__(self, n_inputs: int, 
+                 n_neurons: int,
+                 weight_regularizer_L1: Union[float, int] = 0,
+                 weight_regularizer_L2: Union[float, int] = 0, 
+                 bias_regularizer_L1: Union[float, int] = 0,
+                 bias_regularizer_L2: Union[float, int] = 0,
+                 *,
+                 initializer: str = "random",
+                 dtype: DTypeLike = np.float64,
+                 rng: Optional[np.random.Generator] = None) -> None:
+        """
+        #### Note
+            - weights initialization is one of crucial part in model convergence.
+            - without rng the global np.random state is used (as before).
+        """
+        if initializer not in ("random", "he", "xavier"):
+            raise ValueError(f"unknown initializer: {initializer}")
+        self.n_inputs = n_inputs
+        self.n_neurons = n_neurons
+        self.initializer = initializer
+        self.dtype = np.dtype(dtype)
+        self.init_params(rng)
+        # L1 strength
+        self.weight_regularizer_L1 = weight_regularizer_L1
+        self.bias_regularizer_L1 = bias_regularizer_L1
+        # L2 strength
+        self.weight_regularizer_L2 = weight_regularizer_L2
+        self.bias_regularizer_L2 = bias_regularizer_L2
+        # gradient accumulation over micro-batches, set by Model.train
+        self.accumulate = False
+        # pruning (see pruning.py): weights kept at zero during fine-tuning, CSR weights.T for inference
+        self.weight_mask = None
+        self.sparse_weights = None
+
+    def forward(self, inputs: Float64Array2D, training: bool = False) -> None:
+        self.inputs = inputs
+        if self.sparse_weights is not None and not training:
+            self.output = (self.sparse_weights @ inputs.T).T + self.biases
+            return
+        self.output = np.dot(inputs, self.weights) + self.biases
+        
+    def backward(self, dvalues: Float64Array2D) -> None:
+        """
+        #### Note
+        - compute gradients.
+        - apply regularization to computed gradients.
+        - accumulate mode: adds the sample weighted gradients in place, regularization waits for apply_accumulated.
+        """
+        dweights = np.dot(self.inputs.T, dvalues)
+        dbiases = np.sum(dvalues, axis=0, keepdims=True)
+        self.dinputs = np.dot(dvalues, self.weights.T)
+        if self.accumulate:
+            samples = len(dvalues)
+            dweights *= samples
+            dbiases *= samples
+            self.dweights += dweights
+            self.dbiases += dbiases
+            self.accumulated_samples += samples
+            return
+        self.dweights = dweights
+        self.dbiases = dbiases
+        self.regularize()
+
+    def zero_grad(self) -> None:
+        """
+        - starts a new accumulation step.
+        """
+        self.dweights = np.zeros_like(self.weights)
+        self.dbiases = np.zeros_like(self.biases)
+        self.accumulated_samples = 0
+
+    def apply_accumulated(self) -> None:
+        """
+        - turns accumulated sums into the mean gradient over all micro-batch samples.
+        - regularization is applied once per step.
+        """
+        self.dweights /= self.accumulated_samples
+        self.dbiases /= self.accumulated_samples
+        self.regularize()
+
+    def regularize(self) -> None:
+        # apply L1
+        if self.weight_regularizer_L1 > 0:
+            dL1 = np.ones_like(self.weights)
+            dL1[self.weights < 0] = -1
+            self.dweights += self.weight_regularizer_L1 * dL1
+        if self.bias_regularizer_L1 > 0:
+            dL1 = np.ones_like(self.biases)
+            dL1[self.biases < 0] = -1
+            self.dbiases += self.bias_regularizer_L1 * dL1
+        # apply L2
+        if self.weight_regularizer_L2 > 0:
+            self.dweights += 2 * self.weight_regularizer_L2 * self.weights
+        if self.bias_regularizer_L2 > 0:
+            self.dbiases += 2 * self.bias_regularizer_L2 * self.biases
+
+    def output_shape(self, input_shape: Tuple[int, ...]) -> Tuple[int, ...]:
+        if input_shape[-1:] != (self.n_inputs,):
+            raise ValueError(f"Layer_Dense expects {self.n_inputs} input features, got shape {input_shape}")
+        return input_shape[:-1] + (self.n_neurons,)
+
+    def flops(self, batch_size: int, input_shape: Tuple[int, ...]) -> Tuple[int, int]:
+        """
+        - forward: dot (2 * B * in * out) + bias add, backward: dweights and dinputs dots + dbiases sum.
+        """
+        dot = 2 * batch_size * self.n_inputs * self.n_neurons
+        return dot + batch_size * self.n_neurons, 2 * dot + batch_size * self.n_neurons
+
+    def init_params(self, rng: Optional[np.random.Generator] = None) -> None:
+        """
+        #### Note
+            - samples weights straight in self.dtype when a Generator is given, no float64 temporary.
+            - without rng sampling waits for the first use of weights (global np.random state),
+              so Model(seed=...) can draw them from its own stream without drawing twice.
+            - sets self.seeded when rng is given.
+        """
+        self._weights = None if rng is None else self._sample_weights(rng)
+        self.biases = np.zeros((1, self.n_neurons), dtype=self.dtype)
+        # weights come from an explicit stream, Model(seed=...) leaves them alone
+        self.seeded = rng is not None
+
+    def _sample_weights(self, rng: Optional[np.random.Generator]) -> np.ndarray:
+        """
+        - scaling is done in place.
+        """
+        shape = (self.n_inputs, self.n_neurons)
+        if rng is None:
+            weights = np.random.randn(*shape).astype(self.dtype, copy=False)
+        else:
+            weights = rng.standard_normal(shape, dtype=self.dtype)
+        if self.initializer == "he":
+            scale = np.sqrt(2. / self.n_inputs)
+        elif self.initializer == "xavier":
+            scale = np.sqrt(2. / (self.n_inputs + self.n_neurons))
+        else:
+            scale = 0.01
+        weights *= scale
+        return weights
+
+    @property
+    def weights(self) -> np.ndarray:
+        if self._weights is None:
+            self._weights = self._sample_weights(None)
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: np.ndarray) -> None:
+        self._weights = weights
+
+        
+class Layer_Dropout:
+    """
+    #### what
+        - Dropout is a regularization technique where randomly selected neurons are ignored during training.
+        - args: rate (percentage of neurons to be deactivated)
+    #### Improve
+    #### Flow
+        - [init -> (forward -> backward)]
+        - create binary mask from sample
+    """
+
+    def __init__(self, rate: Union[float, int], rng: Optional[np.random.Generator] = None) -> None:
+        """
+        - rate = 1-rate # np.random.binomial expects probability of success (1) not failure (0)
+        - without rng the global np.random state is used.
+        """
+        self.rate = 1 - rate
+        self.rng = rng
+
+    def set_rng(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+
+    def forward(self, 
+                inputs: Float64Array2D, 
+                training: bool) -> None:
+        """
+        - divide the mask by the rate to scale the values.
+        """
+        self.inputs = inputs
+        if not training:
+            self.output = inputs.copy()
+            return
+        rng = np.random if self.rng is None else self.rng
+        self.binary_mask = rng.binomial(1, self.rate, size=self.inputs.shape).astype(inputs.dtype) / self.rate
+        self.output = self.inputs * self.binary_mask
+
+    def backward(self, dvalues: Float64Array2D) -> None:
+        self.dinputs = dvalues * self.binary_mask
+
+    def flops(self, batch_size: int, input_shape: Tuple[int, ...]) -> Tuple[int, int]:
+        # sample and scale mask, apply mask
+        elements = batch_size * int(np.prod(input_shape))
+        return 3 * elements, elements
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING
+
+from . import kernels
+from .activations import Activation_Softmax
+
+if TYPE_CHECKING:
+    from typing import List, Tuple, Union
+    from ._typing import Float64Array2D
+    from .layers import Layer_Dense
+
+
+class Loss:
+    """
+    #### what
+        - Base class for loss functions.
+    #### Improve
+        - Implement additional loss functions as needed.
+    ### Flow
+        - [remember_trainable_layers -> regularization_loss -> calculate]
+        - remember_trainable_layers method sets self.trainable_layers property.
+        - regularization_loss method calculates the regularization loss using layers in self.trainable_layers.
+        - calculate method calculates the data loss using child class's forward method and regularization loss from regularization_loss method.
+    """
+
+    def remember_trainable_layers(self, trainable_layers: List[Union[Layer_Dense]]) -> None:
+        self.trainable_layers = trainable_layers
+
+    def regularization_loss(self) -> float:
+        regularization_loss: float = .0
+        for layer in self.trainable_layers:
+            # L1 penalty
+            if layer.weight_regularizer_L1 > 0:
+                regularization_loss += layer.weight_regularizer_L1 * np.sum(np.abs(layer.weights))
+            if layer.bias_regularizer_L1 > 0:
+                regularization_loss += layer.bias_regularizer_L1 * np.sum(np.abs(layer.biases))
+            # L2 penalty
+            if layer.weight_regularizer_L2 > 0:
+                regularization_loss += layer.weight_regularizer_L2 * np.sum(layer.weights * layer.weights)
+            if layer.bias_regularizer_L2 > 0:
+                regularization_loss += layer.bias_regularizer_L2 * np.sum(layer.biases * layer.biases)
+        return regularization_loss
+
+    def calculate(self, 
+                  output: Float64Array2D, 
+                  y, # y type can be one-hot encoded or sparse lables
+                  *, 
+                  include_regularization: bool=False) -> Union[float, Tuple[np.float64, np.float64]]:
+        """
+        #### Note
+            - data loss is the mean of sample losses
+            - regularization loss is the sum of L1 and L2 penalties
+            - returns only data loss by default
+        """
+        sample_losses = self.forward(output, y)
+        data_loss = np.mean(sample_losses)
+        if not include_regularization:
+            return data_loss
+        return data_loss, self.regularization_loss()
+
+    def flops(self, batch_size: int, input_shape: Tuple[int, ...]) -> Tuple[int, int]:
+        """
+        - rough count for elementwise losses: clip/log/mean forward, a few ops per element backward.
+        """
+        elements = batch_size * int(np.prod(input_shape))
+        return 6 * elements, 6 * elements
+    
+
+class Loss_CategoricalCrossentropy(Loss):
+    """
+   #### what
+        - Categorical cross-entropy loss function is used in multi-class (3 and more) classification tasks.
+        - It's the negative-log-likelihood of likelihood function 
+        - use to find the MLE (Maximum Likelihood Estimation) of the model.
+    #### Improve
+    #### Flow
+        - [forward -> backward]
+        - formula: -sum(y_true * log(y_pred))
+    """
+    def forward(self,
+                y_pred: Float64Array2D, 
+                y_true) -> np.ndarray[Tuple[int], np.dtype[np.float64]]:  # y_true type can be one-hot encoded or sparse lables
+        """
+        #### Note
+            - clips the predicted values to prevent division by zero, log of zero is undefined and derivate of log(x) is 1/x precision overflows.
+            - clips both sides to not drag mean towards any value
+            - computes the negative log likelihood of only the correct class probabilities. -( 0.log(x.x) + 1.log(x.x) + 0.log(x.x) + 0.log(x.x) ) 
+        """
+        samples = len(y_pred)
+        y_pred_clipped = np.clip(y_pred, 1e-7, 1 - 1e-7)
+        if len(y_true.shape) == 1:
+            correct_confidences = y_pred_clipped[range(samples), y_true]
+        elif len(y_true.shape) == 2:
+            correct_confidences = np.sum(y_pred_clipped * y_true, axis=1)
+        negative_log_likelihoods = -np.log(correct_confidences)
+        return negative_log_likelihoods
+        
+
+    def backward(self, dvalues: Float64Array2D, 
+                 y_true) -> None: 
+        """
+        #### Note
+            - Expects y_true to be one-hot encoded.
+            - **normalizes the gradient by the number of samples.**
+        """
+        samples = len(dvalues)
+        labels = len(dvalues[0])
+        if len(y_true.shape) == 1:
+            y_true = np.eye(labels)[y_true]
+        
+        self.dinputs = -y_true / dvalues
+        self.dinputs = self.dinputs / samples
+
+
+class Activation_Softmax_Loss_CategoricalCrossentropy:
+    """
+    #### what
+        - Softmax classifier is a combination of softmax activation and categorical cross-entropy loss.
+        - peforms backward pass in a single step faster than traditional (softmax and categorical cross-entropy loss) backward methods.
+        - gradients of loss functions with respect to the penultimate layer's outputs reduced to a single step.
+    #### Improve    
+    #### Flow
+        - [init -> forward -> backward]
+        - formula = predicted values - true values
+    """
+
+    def __init__(self) -> None:
+        self.activation = Activation_Softmax()
+        self.loss = Loss_CategoricalCrossentropy()
+
+    def forward(self, inputs: Float64Array2D, y_true) -> np.float64:
+        """
+        #### Note
+            - performs forward method of softmax and loss classes.
+        """
+        self.activation.forward(inputs)
+        self.output = self.activation.output
+        return self.loss.calculate(self.output, y_true)
+    
+    def backward(self, dvalues: Float64Array2D, y_true) -> None:
+        """
+        #### Note
+            - expects y_true to be sparse labels
+            - copy the dvalues to self.dinputs
+            - compute gradient and normalize them
+        """
+        samples = len(dvalues)
+        if len(y_true.shape) == 2:
+            y_true = np.argmax(y_true, axis=1)
+        self.dinputs = dvalues.copy()
+        self.dinputs[range(samples), y_true] -= 1
+        self.dinputs = self.dinputs / samples
+
+    def flops(self, batch_size: int, input_shape: Tuple[int, ...]) -> Tuple[int, int]:
+        """
+        - backward only (copy, subtract 1 at the true class, normalize), forward is done by the softmax and loss.
+        """
+        elements = batch_size * int(np.prod(input_shape))
+        return 0, 2 * elements + batch_size
+
+class Loss_BinaryCrossentropy(Loss):
+    """
+    what it is?
+        * Binary cross-entropy loss function is used in binary regression models.
+        * used primarily in the multi-label classification problem.
+    where we can improvize?
+    why it is used?
+        * Unlike categorical cross-entropy, it measures negative-log-likelihood of each output neurons seperately and average them.
+    how it works?
+        * forward
+        * backward
+        * formula: -sum(y_true * log(y_pred) + (1 - y_true) * log(1 - y_pred))
+        * Each sample loss is a vector of output neuron's losses and it's average used as the final loss for that sample.
+    """
+
+    def forward(self, 
+                y_pred: Float64Array2D, 
+                y_true: np.ndarray[Tuple[int, int], np.dtype[np.int64]]) -> np.ndarray[Tuple[int], np.dtype[np.float64]]:
+        """
+        what it does?
+            * clips the predicted values to prevent division by zero, log of zero is undefined and derivate of log(x) is 1/x precision overflows.
+            * clips both sides to not drag mean towards any value
+            * calculates negative log likelihood of each outputs of a sample and average them.
+            * fused single pass kernel when active (see kernels.py).
+        """
+        if kernels.use("bce_forward", y_pred, y_true):
+            return kernels.bce_forward(y_pred, y_true)
+        # np.log(1e-323) = -inf
+        y_pred_clipped = np.clip(y_pred, 1e-7, 1 - 1e-7)
+        sample_losses = -(y_true * np.log(y_pred_clipped) + (1 -y_true) * np.log(1 - y_pred_clipped))
+        sample_losses = np.mean(sample_losses, axis=-1)
+        return sample_losses
+
+    def backward(self, 
+                 dvalues: Float64Array2D, 
+                 y_true: np.ndarray[Tuple[int, int], np.dtype[np.int64]]) -> None:
+        """
+        what it does?
+            * Final loss of a sample is average of each output neuron's loss.
+            * gradient of sub each neuron's loss is - ((y_true / y_pred) - (1 - y_true) / (1 - y_pred))
+            * partial derivative of final loss w.r.t output neuron's value is - ((y_true / y_pred) - (1 - y_true) / (1 - y_pred)) / outputs
+            * normalize the gradient by the number of samples in the batch.
+            * fused single pass kernel when active (see kernels.py).
+        """
+        if kernels.use("bce_backward", dvalues, y_true):
+            self.dinputs = kernels.bce_backward(dvalues, y_true)
+            return
+        samples = len(dvalues)
+        outputs = len(dvalues[0])
+        clipped_dvalues = np.clip(dvalues, 1e-7, 1 - 1e-7)
+        self.dinputs = -((y_true / clipped_dvalues) - (1 - y_true)/(1 - clipped_dvalues)) / outputs
+        self.dinputs /= samples
+
+
+class Loss_MeanSquaredError(Loss):
+    """
+    what it is?
+        * Mean squared error(MSE) L2 loss function is used in single or multiple output regression tasks.
+    where we can improvize?
+    why it is used?
+        * MSE(L2) most commonly used loss function for regression tasks over MAE(L1).
+    how it works?
+        * forward
+        * backward
+        * Assumption is that the error residuals are normally distributed.
+        * refer to it's likelihood function for intuitive understanding.
+    """
+
+    def forward(self, y_pred: Float64Array2D,
+                 y_true: Float64Array2D) -> np.ndarray[Tuple[int], np.dtype[np.float64]]:
+        """
+        * loss formula: mean((y_true - y_pred)^2) applies to each sample in a batch.
+        """
+        sample_losses = np.mean((y_true - y_pred)**2, axis=-1)
+        return sample_losses
+
+    def backward(self, dvalues: Float64Array2D, 
+                 y_true: Float64Array2D) -> None:
+        """
+        what it does?
+            * computes gradient of loss functions with respect to the predicted values.
+            * formula = -2 * (y_true - y_pred) / outputs is for one of predicted outputs in a sample.
+            * normalize the gradient by the number of samples in the batch.
+        """
+        samples = len(dvalues)
+        outputs = len(dvalues[0])
+        self.dinputs = -2 * (y_true - dvalues) / outputs
+        self.dinputs = self.dinputs / samples
+
+
+class Loss_MeanAbsoluteError(Loss):
+    """
+    what it is?
+        * Mean absolute error(MAE) L1 loss function is used in single or multiple output regression tasks.
+    where we can improvize?
+    why it is used?
+        * MAE(L1) is less sensitive to outliers than MSE(L2).
+        * It is used in regression tasks where outliers are present.
+    how it works?
+        * forward
+        * backward
+        * Assumption is that the error residuals are Laplace distributed.
+    """
+
+    def forward(self, 
+                y_pred: Float64Array2D, 
+                y_true: Float64Array2D) -> np.ndarray[Tuple[int], np.dtype[np.float64]]:
+        """
+        * loss formula: mean(abs(y_true - y_pred)) applies to each sample in a batch.
+        """
+        sample_losses = np.mean(np.abs(y_true - y_pred), axis=-1)
+        return sample_losses
+
+    def backward(self, 
+                 dvalues: Float64Array2D,
+                y_true: Float64Array2D) -> None:
+        """
+        what it does?
+            * computes gradient of loss functions with respect to the predicted values.
+            * formula = sign(y_true - y_pred) / outputs is for one of predicted outputs in a sample.
+            * The derivative of an absolute value equals 1 if this value is greater than 0, or -1 if it’s less than 0. The derivative does not exist for a value of 0
+            * np.sign returns -1 for negative values, 0 for 0, and 1 for positive values.
+            * normalize the gradient by the number of samples in the batch.
+        """
+        samples = len(dvalues)
+        outputs = len(dvalues[0])
+        self.dinputs = np.sign(y_true - dvalues) / outputs
+        self.dinputs = self.dinputs / samples
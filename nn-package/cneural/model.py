@@ -0,0 +1,343 @@
+import numpy as np
+from .layers import Layer_Input, Layer_Dropout, make_rng
+from .activations import Activation_Softmax
+from .losses import Loss_CategoricalCrossentropy, Activation_Softmax_Loss_CategoricalCrossentropy
+
+# stream ids under the model seed, see make_rng
+STREAM_INIT = 0
+STREAM_DROPOUT = 1
+STREAM_SHUFFLE = 2
+
+class Model:
+    def __init__(self, *, seed=None):
+        self.layers = []
+        self.softmax_classifier_output = None
+        # one seed drives initialization, shuffling and dropout
+        self.seed = seed
+
+    def add(self, layer):
+
+        self.layers.append(layer)
+
+    def set(self, *, loss, optimizer, accuracy):
+    
+        self.loss = loss
+        self.optimizer = optimizer
+        self.accuracy = accuracy
+
+    def finlaize(self, input_shape=None, batch_size=1, *, dtype=None):
+        """
+        - input_shape (features per sample) turns on shape checking and the memory plan, see plan_memory.
+        - dtype of the input layer, defaults to the dtype of the first Layer_Dense so that
+          float32 batches are not converted back to float64.
+        """
+        if dtype is None:
+            dtype = next((layer.dtype for layer in self.layers if hasattr(layer, 'init_params')), np.float64)
+        self.input_layer = Layer_Input(dtype)
+
+        layer_count = len(self.layers)
+        self.trainable_layers = []
+
+        for i in range(layer_count):
+
+            if i == 0:
+                self.layers[i].prev = self.input_layer
+                self.layers[i].next = self.layers[i+1]
+
+            elif i < layer_count - 1:
+                self.layers[i].prev = self.layers[i-1]
+                self.layers[i].next = self.layers[i+1]
+
+            else:
+                self.layers[i].prev = self.layers[i-1]
+                self.layers[i].next = self.loss
+                self.output_layer_activation = self.layers[i]
+
+            # draw weights from the layer's own stream, once: layers built with an rng
+            # or seeded earlier keep their weights.
+            # before the hasattr check below, which would sample unseeded weights from np.random
+            if self.seed is not None and hasattr(self.layers[i], 'init_params') and not self.layers[i].seeded:
+                self.layers[i].init_params(self.rng(STREAM_INIT, i))
+
+            if hasattr(self.layers[i], 'weights'):
+                self.trainable_layers.append(self.layers[i])
+
+        self.loss.remember_trainable_layers(self.trainable_layers)
+
+        if isinstance(self.layers[-1], Activation_Softmax) and isinstance(self.loss, Loss_CategoricalCrossentropy):
+            self.softmax_classifier_output = Activation_Softmax_Loss_CategoricalCrossentropy()
+
+        if input_shape is not None:
+            self.plan = self.plan_memory(input_shape, batch_size)
+
+    def plan_memory(self, input_shape, batch_size):
+        """
+        - propagates shapes through every layer and the loss, raises ValueError on the first mismatch.
+        - per layer: params, activation bytes (output + dinputs, + mask for dropout), optimizer state bytes, forward/backward FLOPs.
+            - layers without flops() count as (0, 0).
+            - with softmax + categorical cross-entropy the fused backward is counted, not the softmax jacobian.
+        - peak_bytes = params + gradients + optimizer state + input batch + all activations + temporaries.
+            - temporaries: two of the largest layer output (forward/backward expressions) and
+              state + 2 of the largest weight matrix (optimizer update expressions).
+        - estimate only, NumPy temporaries inside an expression are not tracked one by one.
+        """
+        if isinstance(input_shape, int):
+            input_shape = (input_shape,)
+        shape = tuple(input_shape)
+        itemsize = np.dtype(self.input_layer.dtype).itemsize
+        state_per_param = getattr(self.optimizer, 'state_per_param', 0)
+
+        rows = []
+        largest_output = largest_weights = 0
+        for i, layer in enumerate(self.layers):
+            if hasattr(layer, 'output_shape'):
+                try:
+                    output_shape = layer.output_shape(shape)
+                except ValueError as error:
+                    raise ValueError(f'layer {i}: {error}') from error
+            else:
+                output_shape = shape
+            if hasattr(layer, 'weights'):
+                itemsize = max(itemsize, layer.weights.itemsize)
+                params = layer.weights.size + layer.biases.size
+                largest_weights = max(largest_weights, layer.weights.size)
+            else:
+                params = 0
+            elements = batch_size * int(np.prod(output_shape))
+            largest_output = max(largest_output, elements)
+            cached = 3 if isinstance(layer, Layer_Dropout) else 2
+            flops = getattr(layer, 'flops', None)
+            flops_forward, flops_backward = flops(batch_size, shape) if flops is not None else (0, 0)
+            # the fused softmax + cross-entropy backward replaces the softmax jacobian, counted on the loss row
+            if self.softmax_classifier_output is not None and i == len(self.layers) - 1:
+                flops_backward = 0
+            rows.append({
+                'layer': f'{i} {type(layer).__name__}',
+                'output_shape': (batch_size,) + output_shape,
+                'params': params,
+                'activation_bytes': cached * elements * itemsize,
+                'optimizer_bytes': state_per_param * params * itemsize,
+                'flops_forward': flops_forward,
+                'flops_backward': flops_backward,
+            })
+            shape = output_shape
+
+        flops_forward, flops_backward = self.loss.flops(batch_size, shape)
+        if self.softmax_classifier_output is not None:
+            flops_backward = self.softmax_classifier_output.flops(batch_size, shape)[1]
+        rows.append({
+            'layer': type(self.loss).__name__,
+            'output_shape': (batch_size,) + shape,
+            'params': 0,
+            'activation_bytes': batch_size * int(np.prod(shape)) * itemsize,
+            'optimizer_bytes': 0,
+            'flops_forward': flops_forward,
+            'flops_backward': flops_backward,
+        })
+
+        params = sum(row['params'] for row in rows)
+        total = {
+            'params': params,
+            'param_bytes': params * itemsize,
+            'gradient_bytes': params * itemsize,
+            'optimizer_bytes': sum(row['optimizer_bytes'] for row in rows),
+            'input_bytes': batch_size * int(np.prod(input_shape)) * itemsize,
+            'activation_bytes': sum(row['activation_bytes'] for row in rows),
+            'flops_forward': sum(row['flops_forward'] for row in rows),
+            'flops_backward': sum(row['flops_backward'] for row in rows),
+        }
+        temporary_bytes = (2 * largest_output + (state_per_param + 2) * largest_weights) * itemsize
+        total['peak_bytes'] = (total['param_bytes'] + total['gradient_bytes'] + total['optimizer_bytes'] +
+                               total['input_bytes'] + total['activation_bytes'] + temporary_bytes)
+        return {'layers': rows, 'total': total}
+
+    def summary(self):
+
+        print(f'{"layer":<40}{"output":>16}{"params":>12}{"act MB":>10}{"opt MB":>10}{"fwd MFLOP":>12}{"bwd MFLOP":>12}')
+        for row in self.plan['layers']:
+            print(f'{row["layer"]:<40}{str(row["output_shape"]):>16}{row["params"]:>12}' +
+                  f'{row["activation_bytes"] / 1e6:>10.2f}{row["optimizer_bytes"] / 1e6:>10.2f}' +
+                  f'{row["flops_forward"] / 1e6:>12.2f}{row["flops_backward"] / 1e6:>12.2f}')
+        total = self.plan['total']
+        print(f'params: {total["params"]}, ' +
+              f'params + grads: {(total["param_bytes"] + total["gradient_bytes"]) / 1e6:.2f} MB, ' +
+              f'optimizer: {total["optimizer_bytes"] / 1e6:.2f} MB, ' +
+              f'activations: {total["activation_bytes"] / 1e6:.2f} MB, ' +
+              f'peak: {total["peak_bytes"] / 1e6:.2f} MB')
+    
+    def train(self, X, y=None, *, epochs=1, print_every=1, validation_data=None, accumulate_steps=1):
+        """
+        - X, y: whole training set in memory, one step per epoch.
+            - with accumulate_steps > 1 the set is split into that many micro-batches, the step is the same,
+              memory for activations is one micro-batch.
+        - X alone: streaming dataset (see dataset.Dataset_Shards), one step per batch.
+            - batches(epoch) yields (batch_X, batch_y), called as batches(epoch, rng) when the model is seeded.
+            - optional reset_stats() and stats() (rows_per_second, read_MBps, read_fraction) add a data line to the summary.
+        - accumulate_steps: sum gradients over this many batches before one optimizer step.
+            - effective batch is accumulate_steps * batch size, memory stays at one batch.
+        """
+        if accumulate_steps < 1:
+            raise ValueError(f'accumulate_steps must be at least 1: {accumulate_steps}')
+        streaming = hasattr(X, 'batches')
+        accumulate = accumulate_steps > 1
+        for layer in self.trainable_layers:
+            layer.accumulate = accumulate
+            # CSR copies go stale once weights change
+            layer.sparse_weights = None
+
+        # initialize accuracy object
+        if not streaming:
+            self.accuracy.init(y)
+
+        # main training loop
+        for epoch in range(1, epochs + 1):
+
+            if streaming:
+                if hasattr(X, 'reset_stats'):
+                    X.reset_stats()
+                # shuffling follows the model seed when there is one
+                if self.seed is not None:
+                    batches = X.batches(epoch, self.rng(STREAM_SHUFFLE, epoch))
+                else:
+                    batches = X.batches(epoch)
+            elif accumulate:
+                # one step over the whole set, at most one micro-batch per sample
+                parts = min(accumulate_steps, len(X))
+                batches = zip(np.array_split(X, parts), np.array_split(y, parts))
+            else:
+                batches = [(X, y)]
+
+            # epoch summary is the sample weighted mean over steps
+            samples = 0
+            data_loss_sum = regularization_loss_sum = accuracy_sum = 0.
+            # stays -1 when the dataset yields no batch
+            step = -1
+
+            for step, (batch_X, batch_y) in enumerate(batches):
+
+                if streaming and epoch == 1 and step == 0:
+                    self.accuracy.init(batch_y)
+
+                if accumulate and step % accumulate_steps == 0:
+                    for layer in self.trainable_layers:
+                        layer.zero_grad()
+
+                self.set_step_rngs(epoch, step)
+
+                # perform the forward pass
+                output = self.forward(batch_X, training=True)
+
+                data_loss, regularization_loss = self.loss.calculate(output, batch_y, include_regularization=True)
+
+                predictions = self.output_layer_activation.predictions(output)
+                accuracy = self.accuracy.calculate(predictions, batch_y)
+
+                # perform the backward pass
+                self.backward(output, batch_y)
+
+                # optimize (update parameters)
+                if (step + 1) % accumulate_steps == 0:
+                    self.update_params(accumulate)
+
+                samples += len(batch_X)
+                data_loss_sum += data_loss * len(batch_X)
+                regularization_loss_sum += regularization_loss * len(batch_X)
+                accuracy_sum += accuracy * len(batch_X)
+
+            # leftover micro-batches at the end of the epoch
+            if (step + 1) % accumulate_steps:
+                self.update_params(accumulate)
+
+            # print the summary
+            if samples and not epoch % print_every:
+                data_loss = data_loss_sum / samples
+                regularization_loss = regularization_loss_sum / samples
+                loss = data_loss + regularization_loss
+                accuracy = accuracy_sum / samples
+                print(f'epoch: {epoch}, ' +
+                      f'acc: {accuracy:.3f}, ' +
+                      f'loss: {loss:.3f} (' +
+                      f'data_loss: {data_loss:.3f}, ' +
+                      f'reg_loss: {regularization_loss:.3f}), ' +
+                      f'lr: {self.optimizer.current_learning_rate}')
+                if hasattr(X, 'stats'):
+                    stats = X.stats()
+                    print(f'data, ' +
+                          f'rows/s: {stats["rows_per_second"]:.0f}, ' +
+                          f'read: {stats["read_MBps"]:.1f} MB/s, ' +
+                          f'read_fraction: {stats["read_fraction"]:.2f}')
+
+            if validation_data is not None:
+
+                X_val, y_val = validation_data
+
+                output = self.forward(X_val, training=False)
+
+                loss = self.loss.calculate(output, y_val)
+                predictions = self.output_layer_activation.predictions(output)
+                accuracy = self.accuracy.calculate(predictions, y_val)
+                
+                # print the summary
+                print(f'validation, ' +
+                      f'acc: {accuracy:.3f}, ' +
+                      f'loss: {loss:.3f}')
+
+        for layer in self.trainable_layers:
+            layer.accumulate = False
+
+    def update_params(self, accumulate=False):
+
+        if accumulate:
+            for layer in self.trainable_layers:
+                layer.apply_accumulated()
+
+        self.optimizer.pre_update_params()
+        for layer in self.trainable_layers:
+            self.optimizer.update_params(layer)
+            # keep pruned weights at zero
+            if layer.weight_mask is not None:
+                layer.weights *= layer.weight_mask
+        self.optimizer.post_update_params()
+
+    def rng(self, *key):
+        """
+        - Generator for stream key under the model seed.
+        - a worker given the same key gets the same stream, so results do not depend on worker count.
+        """
+        return make_rng(self.seed, *key)
+
+    def set_step_rngs(self, *step):
+        """
+        - gives every dropout layer its own stream for this step, keyed by (layer index, *step).
+        - no-op without a seed, layers keep the global np.random state.
+        """
+        if self.seed is None:
+            return
+        for i, layer in enumerate(self.layers):
+            if hasattr(layer, 'set_rng'):
+                layer.set_rng(self.rng(STREAM_DROPOUT, i, *step))
+
+    def forward(self, X, training):
+    
+        self.input_layer.forward(X, training)
+
+        for layer in self.layers:
+            layer.forward(layer.prev.output, training)
+        
+        return layer.output
+    
+    def backward(self, output, y):
+
+        if self.softmax_classifier_output is not None:
+            self.softmax_classifier_output.backward(output, y)
+            self.layers[-1].dinputs = self.softmax_classifier_output.dinputs
+            
+            for layer in reversed(self.layers[:-1]):
+                layer.backward(layer.next.dinputs)
+
+            return
+
+        self.loss.backward(output, y)
+
+        for layer in reversed(self.layers):
+            layer.backward(layer.next.dinputs)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .layers import Layer_Dense
+
+
+class Optimizer_SGD:
+    """
+    what it is?
+        * Stochastic Gradient Descent (SGD) is the simplest optimizer.
+        * The SGD optimizer with momentum is usually one of 2 main choices for an optimizer in practice next to the Adam optimizer.
+    where we can improvize?
+        * calculate the limit of iterations before learning rate decays to near zero.
+        * how about implementing a decayer for momentum?
+    why it is used?
+        * It comes with learning rate decay and GD with momentum. Both are crucial for faster convergence.
+    how it works?
+        * init
+        * pre_update_params
+        * update_params
+        * post_update_params
+        * Exponential decay, think about the 1/x graph values in range of x in [1, inf]. get the idea. lr = lr / (1 + x)
+        * Implementation of momentum uses EMWA (Exponentially Weighted Moving Average) of gradients.
+        * weight_update = Wn + Wn-1*M^(n-1) + Wn-2*M^(n-2) + ... + W1*M^0. updates involved of 100% of current gradient and exponential decays of past gradients.
+    """
+    def __init__(self, 
+                 learning_rate: float = 1., 
+                 decay: float = 0., 
+                 momentum: float = 0.) -> None:
+        self.learning_rate = learning_rate
+        self.current_learning_rate = learning_rate
+        self.decay = decay
+        self.iterations = 0
+        self.momentum = momentum
+        # param shaped arrays kept per layer parameter
+        self.state_per_param = 1 if momentum else 0
+
+    def pre_update_params(self):
+        if self.decay:
+            self.current_learning_rate = self.learning_rate * (1. / (1. + self.decay * self.iterations))
+
+    def update_params(self, Layer: Layer_Dense) -> None:
+        if self.momentum:
+            if not hasattr(Layer, "weight_momentums"):
+                Layer.weight_momentums = np.zeros_like(Layer.weights)
+                Layer.bias_momentums = np.zeros_like(Layer.biases)
+            weight_updates = self.momentum * Layer.weight_momentums - self.current_learning_rate * Layer.dweights
+            Layer.weight_momentums = weight_updates
+            bias_updates = self.momentum * Layer.bias_momentums - self.current_learning_rate * Layer.dbiases
+            Layer.bias_momentums = bias_updates
+        else: # Vanilla SGD updates (as before momentum update)
+            weight_updates = -self.current_learning_rate * Layer.dweights
+            bias_updates = -self.current_learning_rate * Layer.dbiases
+        Layer.weights += weight_updates
+        Layer.biases += bias_updates
+
+    def post_update_params(self) -> None:
+        self.iterations += 1
+
+class Optimizer_Adagrad:
+    """
+    what it is?
+        * Adagrad optimizer is an adaptive learning rate optimizer.
+    where we can improvize?
+        * check how division of root squared of past gradients affects the learning rate. especially values le 0
+        * In the very first steps, the learning rate is the update to the parameters Layer.weights += -self.current_learning_rate * 1
+        * Initially, the learning rate is very high, and the updates are very large. lead to divergence.
+        * learning does stall.
+    why it is used?
+        * The idea here is to normalize updates made to the features.
+        * This optimizer is not widely used, except for some specific applications.
+    how it works?
+        * init, pre_update_params, update_params, post_update_params
+        * formula: lr = lr / (sqrt(cache) + epsilon)
+        * test it out in practice, notice how adaptation works in numbers.
+        * After no of epochs, the epoch gradients always less than cache gradients. results in diminishing gradients.
+    """
+    def __init__(self, 
+                 learning_rate: float = 1.,
+                 decay: float = 0., 
+                 epsilon: float = 1e-7) -> None:
+        self.learning_rate = learning_rate
+        self.current_learning_rate = learning_rate
+        self.decay = decay
+        self.iterations = 0
+        self.epsilon = epsilon
+        self.state_per_param = 1
+
+    def pre_update_params(self) -> None:
+        if self.decay:
+            self.current_learning_rate = self.learning_rate * (1. / (1. + self.decay * self.iterations))
+
+    def update_params(self, Layer: Layer_Dense) -> None:
+        if not hasattr(Layer, "weight_cache"):
+            Layer.weight_cache = np.zeros_like(Layer.weights)
+            Layer.bias_cache = np.zeros_like(Layer.biases)
+        Layer.weight_cache += Layer.dweights**2
+        Layer.bias_cache += Layer.dbiases**2
+        Layer.weights += -self.current_learning_rate * Layer.dweights / (np.sqrt(Layer.weight_cache) + self.epsilon)    
+        Layer.biases += -self.current_learning_rate * Layer.dbiases / (np.sqrt(Layer.bias_cache) + self.epsilon)        
+
+    def post_update_params(self) -> None:
+        self.iterations += 1
+
+class Optimizer_RMSprop:
+    """
+    what it is?
+        * RMSprop optimizer is an adaptive learning rate optimizer.
+        * It is a variant of Adagrad optimizer.
+    where we can improvize?
+    why it is used?
+        * It has decaying caching mechanism, which prevents the learning rate from becoming too small.
+        * learning does not stall.
+    how it works?
+        * init, pre_update_params, update_params, post_update_params
+        * learning rate of 0.001 works well and it's default in popular frameworks.   
+    """
+    def __init__(self, 
+                 learning_rate: float = 0.001, 
+                 decay: float = 0., 
+                 epsilon: float = 1e-7, 
+                 beta: float = 0.9) -> None:
+        self.learning_rate = learning_rate
+        self.current_learning_rate = learning_rate
+        self.decay = decay
+        self.iterations = 0
+        self.epsilon = epsilon
+        self.beta = beta
+        self.state_per_param = 1
+
+    def pre_update_params(self) -> None:
+        if self.decay:
+            self.current_learning_rate = self.learning_rate * (1. / (1. + self.decay * self.iterations))
+
+    def update_params(self, Layer: Layer_Dense) -> None:
+        """
+        what it does?
+            * formula: cache = cache * beta + (1 - beta) * gradient^2. EMWA discounting past gradients.
+            * (1 - beta) contribution term and (beta) decay term. test assigned each variable to it.
+        """
+        if not hasattr(Layer, "weight_cache"):
+            Layer.weight_cache = np.zeros_like(Layer.weights)
+            Layer.bias_cache = np.zeros_like(Layer.biases)
+        Layer.weight_cache = self.beta * Layer.weight_cache + (1 - self.beta) * Layer.dweights**2
+        Layer.bias_cache += self.beta * Layer.bias_cache + (1- self.beta) * Layer.dbiases**2
+        Layer.weights += -self.current_learning_rate * Layer.dweights / (np.sqrt(Layer.weight_cache) + self.epsilon)        
+        Layer.biases += -self.current_learning_rate * Layer.dbiases / (np.sqrt(Layer.bias_cache) + self.epsilon)        
+
+    def post_update_params(self) -> None:
+        self.iterations += 1
+
+class Optimizer_Adam:
+    """
+    what it is?
+        * Adaptive Moment Estimation optimizer is an adaptive learning rate optimizer.
+        * It is a combination of RMSprop and Momentum optimizers.
+    where we can improvize?
+        * Adam requires additional memory to store the first and second moment estimates for each parameter.
+    why it is used?
+        * Combines the power of both firsand second moments
+        * Commonly used in deep learning tasks.
+        * It is robust to noisy gradients and sparse gradients
+    how it works?
+        * init, pre_update_params, update_params, post_update_params
+        * bias correction, In inital stages, the first and second moments are biased towards zero.
+    """
+    def __init__(self, 
+                 learning_rate: float = 0.001, 
+                 decay: float = 0., 
+                 epsilon: float = 1e-7, 
+                 beta_1: float = 0.9, 
+                 beta_2: float = 0.999) -> None:
+        self.learning_rate = learning_rate
+        self.current_learning_rate = learning_rate
+        self.decay = decay
+        self.iterations = 0
+        self.epsilon = epsilon
+        self.beta_1 = beta_1        
+        self.beta_2 = beta_2     
+        self.state_per_param = 2
+
+    def pre_update_params(self) -> None:
+        if self.decay:
+            self.current_learning_rate = self.learning_rate * (1. / (1. + self.decay * self.iterations))
+
+    def update_params(self, Layer: Layer_Dense) -> None:
+        """
+        what it does?
+            * params update: w_t = w_t-1 - lr * m_t / (sqrt(v_t) + epsilon)
+            * first moment:  m_t = beta_1 * m_t-1 + (1 - beta_1) * gradient
+            * second moment: v_t = beta_2 * v_t-1 + (1 - beta_2) * gradient^2
+        """
+        if not hasattr(Layer, "weight_cache"):
+            Layer.weight_momentums = np.zeros_like(Layer.weights)
+            Layer.bias_momentums = np.zeros_like(Layer.biases)
+            Layer.weight_cache = np.zeros_like(Layer.weights)
+            Layer.bias_cache = np.zeros_like(Layer.biases)
+        # first moment
+        Layer.weight_momentums = self.beta_1 * Layer.weight_momentums + (1 - self.beta_1) * Layer.dweights
+        Layer.bias_momentums = self.beta_1 * Layer.bias_momentums + (1 - self.beta_1) * Layer.dbiases
+        weight_momentums_corrected = Layer.weight_momentums / (1 - self.beta_1 ** (self.iterations + 1)) # bias correction
+        bias_momentums_corrected = Layer.bias_momentums / (1 - self.beta_1 ** (self.iterations + 1))
+        # second moment
+        Layer.weight_cache = self.beta_2 * Layer.weight_cache + (1 - self.beta_2) * Layer.dweights**2
+        Layer.bias_cache = self.beta_2 * Layer.bias_cache + (1 - self.beta_2) * Layer.dbiases**2
+        weight_cache_corrected = Layer.weight_cache / (1 - self.beta_2 ** (self.iterations + 1)) # bias correction
+        bias_cache_corrected = Layer.bias_cache / (1 - self.beta_2 ** (self.iterations + 1))
+        # params updates
+        Layer.weights += -self.current_learning_rate * weight_momentums_corrected / (np.sqrt(weight_cache_corrected) + self.epsilon)
+        Layer.biases += -self.current_learning_rate * bias_momentums_corrected / (np.sqrt(bias_cache_corrected) + self.epsilon)
+
+    def post_update_params(self) -> None:
+        self.iterations += 1
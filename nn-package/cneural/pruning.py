@@ -0,0 +1,165 @@
+"""
+#### what
+    - pruning for trained models: magnitude (unstructured) and neuron (structured) pruning of Layer_Dense.
+    - sparse inference: Layer_Dense.forward multiplies with CSR weights when sparsify() has set them (needs scipy).
+#### Flow
+    - [train -> prune_magnitude / prune_neurons -> (fine-tune with Model.train) -> sparsify -> Model.forward]
+    - magnitude pruning stores layer.weight_mask, Model.update_params re-applies it after every optimizer step.
+    - neuron pruning removes whole neurons and the matching input rows of the next Layer_Dense, no mask needed.
+    - python -m cneural.pruning prints latency and size against density for both.
+"""
+import copy
+import time
+import numpy as np
+from typing import List, Dict, Tuple
+
+
+def dense_layers(model) -> List:
+    return [layer for layer in model.layers if hasattr(layer, 'weights')]
+
+
+def density(layer) -> float:
+    return np.count_nonzero(layer.weights) / layer.weights.size
+
+
+def prune_magnitude(model, sparsity: float, *, scope: str = "layer") -> None:
+    """
+    #### Note
+        - zeroes the smallest |weights| so that sparsity (fraction of zeros) is reached.
+        - scope "layer" prunes every layer to sparsity, "global" uses one threshold over all layers.
+        - masks only grow, weights pruned earlier stay pruned.
+    """
+    if not 0 <= sparsity < 1:
+        raise ValueError(f"sparsity must be in [0, 1): {sparsity}")
+    if scope not in ("layer", "global"):
+        raise ValueError(f"unknown scope: {scope}")
+    layers = dense_layers(model)
+    if scope == "global":
+        magnitudes = np.concatenate([np.abs(layer.weights).ravel() for layer in layers])
+        threshold = np.quantile(magnitudes, sparsity)
+    for layer in layers:
+        if scope == "layer":
+            threshold = np.quantile(np.abs(layer.weights), sparsity)
+        mask = np.abs(layer.weights) > threshold if sparsity else np.ones(layer.weights.shape, dtype=bool)
+        if layer.weight_mask is not None:
+            mask &= layer.weight_mask
+        layer.weight_mask = mask
+        layer.weights *= mask
+        layer.sparse_weights = None
+
+
+def prune_neurons(model, fraction: float) -> None:
+    """
+    #### Note
+        - removes fraction of the neurons of every hidden Layer_Dense (the output layer is kept).
+        - neuron score: norm of its incoming weights * norm of its outgoing weights in the next Layer_Dense.
+        - layers in between must be elementwise (activations, dropout).
+        - optimizer state of shrunk layers is dropped, it no longer matches the shapes.
+    """
+    if not 0 <= fraction < 1:
+        raise ValueError(f"fraction must be in [0, 1): {fraction}")
+    layers = dense_layers(model)
+    for layer, next_layer in zip(layers[:-1], layers[1:]):
+        scores = np.linalg.norm(layer.weights, axis=0) * np.linalg.norm(next_layer.weights, axis=1)
+        keep = np.sort(np.argsort(scores)[int(fraction * layer.n_neurons):])
+        layer.weights = layer.weights[:, keep]
+        layer.biases = layer.biases[:, keep]
+        next_layer.weights = next_layer.weights[keep]
+        if layer.weight_mask is not None:
+            layer.weight_mask = layer.weight_mask[:, keep]
+        if next_layer.weight_mask is not None:
+            next_layer.weight_mask = next_layer.weight_mask[keep]
+        layer.n_neurons = next_layer.n_inputs = len(keep)
+    for layer in layers:
+        for name in ("weight_momentums", "bias_momentums", "weight_cache", "bias_cache"):
+            if hasattr(layer, name):
+                delattr(layer, name)
+        layer.sparse_weights = None
+
+
+def sparsify(model, max_density: float = 0.1) -> None:
+    """
+    #### Note
+        - gives every Layer_Dense with density <= max_density CSR weights for inference.
+        - CSR only beats the dense BLAS dot at low density (about 0.1), check the crossover with benchmark().
+        - call again after further training, Model.train drops the CSR copies.
+        - scipy is imported here, pruning alone does not need it.
+    """
+    try:
+        from scipy import sparse
+    except ImportError as error:
+        raise ImportError("sparse inference needs scipy") from error
+    for layer in dense_layers(model):
+        # weights.T, so forward is csr @ dense, scipy's fast path
+        layer.sparse_weights = sparse.csr_matrix(layer.weights.T) if density(layer) <= max_density else None
+
+
+def weight_bytes(model) -> int:
+    total = 0
+    for layer in dense_layers(model):
+        if layer.sparse_weights is not None:
+            csr = layer.sparse_weights
+            total += csr.data.nbytes + csr.indices.nbytes + csr.indptr.nbytes
+        else:
+            total += layer.weights.nbytes
+        total += layer.biases.nbytes
+    return total
+
+
+def latency(model, X: np.ndarray, repeat: int = 20) -> float:
+    model.forward(X, training=False)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.forward(X, training=False)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark(model, X: np.ndarray, densities: Tuple[float, ...] = (1., .5, .3, .2, .1, .05)) -> List[Dict[str, float]]:
+    """
+    - prunes copies of a trained model to each density and measures forward latency and weight size.
+    - magnitude pruning is timed dense and with CSR weights, neuron pruning with the shrunk dense layers.
+    """
+    rows = []
+    reference = latency(model, X)
+    print(f'{"density":>8}{"dense ms":>10}{"csr ms":>10}{"csr MB":>10}{"neuron ms":>11}{"neuron MB":>11}')
+    for target in densities:
+        pruned = copy.deepcopy(model)
+        prune_magnitude(pruned, 1 - target)
+        dense_ms = latency(pruned, X) * 1e3
+        sparsify(pruned, max_density=1.)
+        row = {
+            'density': target,
+            'dense_ms': dense_ms,
+            'csr_ms': latency(pruned, X) * 1e3,
+            'csr_bytes': weight_bytes(pruned),
+        }
+        shrunk = copy.deepcopy(model)
+        prune_neurons(shrunk, 1 - target)
+        row['neuron_ms'] = latency(shrunk, X) * 1e3
+        row['neuron_bytes'] = weight_bytes(shrunk)
+        rows.append(row)
+        print(f'{target:>8.2f}{row["dense_ms"]:>10.2f}{row["csr_ms"]:>10.2f}{row["csr_bytes"] / 1e6:>10.2f}' +
+              f'{row["neuron_ms"]:>11.2f}{row["neuron_bytes"] / 1e6:>11.2f}')
+    print(f'unpruned: {reference * 1e3:.2f} ms, {weight_bytes(model) / 1e6:.2f} MB')
+    return rows
+
+
+if __name__ == "__main__":
+    from .layers import Layer_Dense
+    from .activations import Activation_ReLU, Activation_Softmax
+    from .losses import Loss_CategoricalCrossentropy
+    from .optimizers import Optimizer_Adam
+    from .model import Model
+
+    model = Model(seed=0)
+    model.add(Layer_Dense(1024, 1024, initializer="he"))
+    model.add(Activation_ReLU())
+    model.add(Layer_Dense(1024, 1024, initializer="he"))
+    model.add(Activation_ReLU())
+    model.add(Layer_Dense(1024, 10))
+    model.add(Activation_Softmax())
+    model.set(loss=Loss_CategoricalCrossentropy(), optimizer=Optimizer_Adam(), accuracy=None)
+    model.finlaize()
+    benchmark(model, np.random.default_rng(0).standard_normal((256, 1024)))
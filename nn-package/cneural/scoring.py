@@ -0,0 +1,210 @@
+"""
+#### what
+    - batch scoring of large .npy inputs with a pool of processes.
+    - trained weights are copied once into shared memory, workers map them read-only.
+    - workers read chunks of the memory-mapped input and write straight into the output array, nothing is pickled but row ranges.
+#### Improve
+    - share CSR weights (pruning.sparsify) too, workers score with dense weights for now.
+#### Flow
+    - [init -> score -> ... -> close], or use it as a context manager.
+    - output is an .npy file (memory-mapped) when output_path is given, else a temporary .npy in tempfile's
+      default directory that is unlinked once the job is done, the returned memmap is then its only reference.
+    - workers open input and output per chunk, nothing stays mapped in them between chunks or jobs.
+    - a worker that dies (OOM kill, SIGBUS on a full disk) fails the job with BrokenProcessPool instead of hanging it.
+    - run with OMP_NUM_THREADS=1 (or the BLAS equivalent) so that processes, not BLAS threads, share the cores.
+"""
+import os
+import copy
+import time
+import tempfile
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+# per layer attributes that are training state or caches, not needed to score
+_TRANSIENT = ("prev", "next", "inputs", "output", "dinputs", "dweights", "dbiases", "binary_mask",
+              "weight_momentums", "bias_momentums", "weight_cache", "bias_cache", "rng")
+# optional per layer attributes reset to None (dense weights are used)
+_CLEARED = ("weight_mask", "sparse_weights")
+_PARAMS = ("weights", "biases")
+# attributes that hold _PARAMS behind a property (Layer_Dense.weights)
+_STORED = ("_weights",)
+_ALIGN = 64
+
+# worker process state, set by _init_worker
+_layers = None
+_shm = None
+_dtype = None
+
+
+def _init_worker(shm_name: str, layout: List[Tuple[int, str, int, Tuple[int, ...], str]], layers: List, dtype: str) -> None:
+    global _layers, _shm, _dtype
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    for index, name, offset, shape, dtype_str in layout:
+        array = np.ndarray(shape, dtype=dtype_str, buffer=_shm.buf, offset=offset)
+        array.flags.writeable = False
+        setattr(layers[index], name, array)
+    _layers = layers
+    _dtype = np.dtype(dtype)
+
+
+def _forward(inputs: np.ndarray, predictions: bool) -> np.ndarray:
+    output = np.asarray(inputs, dtype=_dtype)
+    for layer in _layers:
+        layer.forward(output, training=False)
+        output = layer.output
+    if predictions:
+        output = _layers[-1].predictions(output)
+    return output.reshape(len(output), -1)
+
+
+def _probe(input_path: str, predictions: bool) -> Tuple[int, str]:
+    """
+    - output width and dtype, from the first input row.
+    """
+    output = _forward(np.load(input_path, mmap_mode="r")[:1], predictions)
+    return output.shape[1], output.dtype.str
+
+
+def _score_chunk(task: Tuple[str, str, int, int, bool]) -> int:
+    """
+    - maps input and output for this chunk only, both are unmapped again when the memmaps go out of scope.
+    """
+    input_path, output_path, start, stop, predictions = task
+    inputs = np.load(input_path, mmap_mode="r")
+    outputs = np.load(output_path, mmap_mode="r+")
+    outputs[start:stop] = _forward(inputs[start:stop], predictions)
+    del inputs, outputs
+    return stop - start
+
+
+class Scorer:
+    """
+    #### what
+        - score a trained Model over many rows with a process pool and shared, read-only weights.
+        - args: model, processes, chunk_rows
+    #### Flow
+        - [init -> score -> close]
+        - init: packs weights and biases of every layer into one shared memory block and starts the pool.
+        - score: splits the input into chunk_rows ranges, workers write their rows of the output in place.
+        - rows_per_second and seconds of the last score() are kept on the instance.
+    """
+
+    def __init__(self, model, *, processes: Optional[int] = None, chunk_rows: int = 65536) -> None:
+        self.chunk_rows = chunk_rows
+        self.processes = processes or mp.cpu_count()
+        self.rows_per_second = 0.
+        self.seconds = 0.
+
+        # weightless copies of the layers, pickled once per worker
+        layers = []
+        params = []
+        for index, layer in enumerate(model.layers):
+            skeleton = copy.copy(layer)
+            for name in _TRANSIENT + _PARAMS + _STORED:
+                skeleton.__dict__.pop(name, None)
+            for name in _CLEARED:
+                if name in skeleton.__dict__:
+                    setattr(skeleton, name, None)
+            layers.append(skeleton)
+            params += [(index, name, getattr(layer, name)) for name in _PARAMS if hasattr(layer, name)]
+
+        # one shared block, each array aligned to _ALIGN bytes
+        layout = []
+        size = 0
+        for index, name, array in params:
+            layout.append((index, name, size, array.shape, array.dtype.str))
+            size += -(-array.nbytes // _ALIGN) * _ALIGN
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for (index, name, offset, shape, dtype), (_, _, array) in zip(layout, params):
+                np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)[...] = array
+            # same input dtype as Model.forward
+            input_dtype = np.dtype(model.input_layer.dtype if hasattr(model, 'input_layer') else np.float64).str
+            self.pool = ProcessPoolExecutor(self.processes, initializer=_init_worker,
+                                            initargs=(self.shm.name, layout, layers, input_dtype))
+        except BaseException:
+            self.shm.close()
+            self.shm.unlink()
+            raise
+
+    def score(self, input_path: str, output_path: Optional[str] = None, *, predictions: bool = False) -> np.ndarray:
+        """
+        #### Note
+            - input_path: .npy file of shape (rows, features), opened memory-mapped by every worker.
+            - output_path: .npy file created memory-mapped. Without it the output lives in an unlinked
+              temporary file (tempfile's default directory, on disk, not RAM backed /dev/shm),
+              freed when the returned array is dropped. Either way a np.memmap is returned, no copy.
+            - predictions=True writes output_layer_activation.predictions instead of raw outputs.
+            - output is always 2D (rows, width), argmax predictions come back as (rows, 1).
+            - raises concurrent.futures.process.BrokenProcessPool when a worker dies, the Scorer is unusable after that.
+        """
+        width, dtype = self.pool.submit(_probe, input_path, predictions).result()
+        shape, dtype = (len(np.load(input_path, mmap_mode="r")), width), np.dtype(dtype)
+        temporary = output_path is None
+        if temporary:
+            handle, output_path = tempfile.mkstemp(suffix=".npy")
+            os.close(handle)
+        try:
+            # the output file exists once open_memmap returns, workers may open it
+            outputs = np.lib.format.open_memmap(output_path, mode="w+", dtype=dtype, shape=shape)
+            tasks = [(input_path, output_path, start, min(start + self.chunk_rows, shape[0]), predictions)
+                     for start in range(0, shape[0], self.chunk_rows)]
+            start_time = time.perf_counter()
+            rows = sum(self.pool.map(_score_chunk, tasks))
+            self.seconds = time.perf_counter() - start_time
+            self.rows_per_second = rows / self.seconds if self.seconds else 0.
+        finally:
+            # the returned memmap keeps the pages, the name is gone
+            if temporary:
+                os.unlink(output_path)
+        return outputs
+
+    def close(self) -> None:
+        try:
+            self.pool.shutdown()
+        finally:
+            self.shm.close()
+            self.shm.unlink()
+
+    def __enter__(self) -> "Scorer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import sys
+    import shutil
+    from .layers import Layer_Dense
+    from .activations import Activation_ReLU, Activation_Softmax
+    from .losses import Loss_CategoricalCrossentropy
+    from .optimizers import Optimizer_Adam
+    from .model import Model
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    model = Model(seed=0)
+    model.add(Layer_Dense(64, 256, initializer="he"))
+    model.add(Activation_ReLU())
+    model.add(Layer_Dense(256, 10))
+    model.add(Activation_Softmax())
+    model.set(loss=Loss_CategoricalCrossentropy(), optimizer=Optimizer_Adam(), accuracy=None)
+    model.finlaize()
+
+    directory = tempfile.mkdtemp()
+    try:
+        input_path = os.path.join(directory, "X.npy")
+        X = np.lib.format.open_memmap(input_path, mode="w+", dtype=np.float32, shape=(rows, 64))
+        X[:] = np.random.default_rng(0).standard_normal((rows, 64), dtype=np.float32)
+        X.flush()
+        del X
+
+        for processes in sorted({1, 2, 4, mp.cpu_count()}):
+            with Scorer(model, processes=processes) as scorer:
+                scorer.score(input_path, os.path.join(directory, "out.npy"))
+                print(f'processes: {processes}, rows/s: {scorer.rows_per_second:.0f}')
+    finally:
+        shutil.rmtree(directory)
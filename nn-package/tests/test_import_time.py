@@ -0,0 +1,14 @@
+from cneural.__main__ import BUDGET_MS, MODEL_OVERHEAD_MS, import_ms
+
+
+def test_bare_import_is_lazy():
+    elapsed, numpy_loaded = import_ms("import cneural")
+    assert not numpy_loaded
+    assert elapsed <= BUDGET_MS
+
+
+def test_model_import_overhead_over_numpy():
+    numpy_ms, _ = import_ms("import numpy")
+    model_ms, numpy_loaded = import_ms("from cneural import Model")
+    assert numpy_loaded
+    assert model_ms - numpy_ms <= MODEL_OVERHEAD_MS